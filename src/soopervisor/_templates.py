@@ -0,0 +1,98 @@
+import re
+import pkgutil
+from functools import lru_cache
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    StrictUndefined,
+    UndefinedError,
+)
+from ploomber.io._commander import to_pascal_case
+
+# a template is "simple" if all its tags are plain variables: {{name}}
+_VARIABLE = re.compile(r"{{\s*(\w+)\s*}}")
+
+# same as jinja's lexer, which converts all newlines to "\n"
+_NEWLINE = re.compile(r"(\r\n|\r|\n)")
+
+
+@lru_cache(maxsize=None)
+def bytecode_cache():
+    """
+    Returns the Jinja bytecode cache shared by the Commander instances that
+    render templates in soopervisor/assets. Compiled templates are stored
+    in the temporary directory, so they are re-used across calls and
+    processes (the cache is invalidated when the template source changes).
+    Returns None if the cache directory cannot be created (e.g., read-only
+    or unsafe temporary directory)
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def environment_kwargs():
+    """
+    Keyword arguments to pass to Commander(environment_kwargs=...). The
+    bytecode cache is an optimization, it is left out if unavailable
+    """
+    cache = bytecode_cache()
+    return {} if cache is None else dict(bytecode_cache=cache)
+
+
+@lru_cache(maxsize=None)
+def _environment():
+    # same settings and filters as Commander
+    env = Environment(
+        loader=PackageLoader("soopervisor", "assets"),
+        undefined=StrictUndefined,
+        **environment_kwargs(),
+    )
+    env.filters["to_pascal_case"] = to_pascal_case
+    return env
+
+
+@lru_cache(maxsize=None)
+def _load(path):
+    """
+    Returns the source of a template in soopervisor/assets, and whether it
+    only substitutes variables
+    """
+    source = pkgutil.get_data("soopervisor", f"assets/{path}").decode()
+    # sources may have CRLF line endings (e.g., git's autocrlf on Windows)
+    source = _NEWLINE.sub("\n", source)
+    simple = (
+        "{%" not in source
+        and "{#" not in source
+        and source.count("{{") == len(_VARIABLE.findall(source))
+    )
+    return source, simple
+
+
+def render(path, **render_kwargs):
+    """
+    Renders a template in soopervisor/assets. Templates that only
+    substitute variables are rendered with a regular expression, which is
+    much faster than going through Jinja; the rest fall back to Jinja. The
+    output is the same either way
+    """
+    source, simple = _load(path)
+
+    if not simple:
+        return _environment().get_template(path).render(**render_kwargs)
+
+    def replace(match):
+        name = match.group(1)
+
+        if name not in render_kwargs:
+            raise UndefinedError(f"{name!r} is undefined")
+
+        return str(render_kwargs[name])
+
+    out = _VARIABLE.sub(replace, source)
+
+    # same as jinja (keep_trailing_newline=False)
+    return out[:-1] if out.endswith("\n") else out
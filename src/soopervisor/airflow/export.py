@@ -3,7 +3,6 @@ Export a Ploomber DAG to Airflow
 """
 
 import json
-import os
 from pathlib import Path
 
 import click
@@ -12,6 +11,7 @@ from ploomber.io._commander import Commander, CommanderStop
 from soopervisor.airflow.config import AirflowConfig
 from soopervisor import commons
 from soopervisor import abc
+from soopervisor import _templates
 
 
 class AirflowExporter(abc.AbstractExporter):
@@ -29,20 +29,22 @@ class AirflowExporter(abc.AbstractExporter):
         Generates a .py file that exposes a dag variable
         """
         click.echo("Exporting to Airflow...")
-        project_root = Path(".").resolve()
-        project_name = project_root.name
+        project_name = commons.source.project_name()
 
         name = f"{cfg.preset}.py"
 
         # TODO: modify Dockerfile depending on package or non-package
         with Commander(
-            workspace=env_name, templates_path=("soopervisor", "assets")
+            workspace=env_name,
+            templates_path=("soopervisor", "assets"),
+            environment_kwargs=_templates.environment_kwargs(),
         ) as e:
-            e.copy_template(
+            path_out = str(Path(env_name, project_name + ".py"))
+            e.info(f"Adding {path_out}...")
+            content = _templates.render(
                 f"airflow/{name}", project_name=project_name, env_name=env_name
             )
-            path_out = str(Path(env_name, project_name + ".py"))
-            os.rename(Path(env_name, name), path_out)
+            Path(path_out).write_text(content)
 
             if cfg.preset != "bash":
                 e.copy_template(
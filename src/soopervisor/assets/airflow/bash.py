@@ -19,15 +19,17 @@ dag = DAG(
 path_to_spec = Path(__file__).parent / "{{project_name}}.json"
 spec = json.loads(path_to_spec.read_text())
 
+operators = {}
+
 for task in spec["tasks"]:
-    BashOperator(
+    operators[task["name"]] = BashOperator(
         bash_command=task["command"],
         task_id=task["name"],
         dag=dag,
     )
 
 for task in spec["tasks"]:
-    t = dag.get_task(task["name"])
+    t = operators[task["name"]]
 
     for upstream in task["upstream"]:
-        t.set_upstream(dag.get_task(upstream))
+        t.set_upstream(operators[upstream])
@@ -21,8 +21,10 @@ dag = DAG(
 path_to_spec = Path(__file__).parent / "{{project_name}}.json"
 spec = json.loads(path_to_spec.read_text())
 
+operators = {}
+
 for task in spec["tasks"]:
-    KubernetesPodOperator(
+    operators[task["name"]] = KubernetesPodOperator(
         image=spec["image"],
         cmds=["bash", "-cx"],
         arguments=[task["command"]],
@@ -38,7 +40,7 @@ for task in spec["tasks"]:
     )
 
 for task in spec["tasks"]:
-    t = dag.get_task(task["name"])
+    t = operators[task["name"]]
 
     for upstream in task["upstream"]:
-        t.set_upstream(dag.get_task(upstream))
+        t.set_upstream(operators[upstream])
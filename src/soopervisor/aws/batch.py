@@ -8,6 +8,8 @@ import os
 import json
 from pathlib import Path
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 from ploomber.io._commander import Commander, CommanderStop
 from ploomber_core.dependencies import requires
@@ -17,13 +19,9 @@ from soopervisor.aws.util import TaskResources
 from soopervisor.commons import docker, source
 from soopervisor import commons
 from soopervisor import abc
+from soopervisor import _templates
 from soopervisor.commons.dependencies import get_default_image_key
 
-try:
-    import boto3
-except ModuleNotFoundError:
-    boto3 = None
-
 # TODO:
 # warn on large distribution artifacts - there might be data files
 # make explicit that some errors are happening inside docker
@@ -46,6 +44,97 @@ except ModuleNotFoundError:
 # add a way to skip tests when submitting
 
 
+def _load_run_params(path):
+    """
+    Load the Ploomber Cloud run parameters (.ploomber-cloud file), the parsed
+    content is cached until the file is modified
+    """
+    path = os.path.abspath(path)
+    return _parse_run_params(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_run_params(path, mtime_ns):
+    return json.loads(Path(path).read_text())
+
+
+# max number of concurrent submit_job calls (the batch client's connection
+# pool has the same size, so threads do not wait for a connection)
+_MAX_SUBMIT_WORKERS = 16
+
+
+def _batch_client(region_name):
+    """
+    Returns a boto3 batch client from the default session, the same one
+    boto3.client(...) uses, so boto3.setup_default_session(...) is respected
+    """
+    # importing boto3 is slow, only do it when we need to submit jobs
+    import boto3
+
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+
+    return _client_for(boto3.DEFAULT_SESSION, region_name)
+
+
+@lru_cache(maxsize=4)
+def _client_for(session, region_name):
+    """
+    Creating a client is slow (it loads the service model from disk), so we
+    cache one per (session, region). The session is part of the key so
+    replacing the default session creates a new client
+    """
+    from botocore.config import Config
+
+    config = Config(
+        max_pool_connections=_MAX_SUBMIT_WORKERS, retries={"mode": "adaptive"}
+    )
+    return session.client("batch", region_name=region_name, config=config)
+
+
+def _upstream_levels(tasks):
+    """
+    Groups tasks in levels (Kahn's algorithm), all the upstream dependencies
+    of a task are in previous levels
+
+    Parameters
+    ----------
+    tasks : dict
+        Maps task names to their upstream dependencies
+
+    Returns
+    -------
+    list
+        A list of lists with task names, one per level
+    """
+    order = {name: idx for idx, name in enumerate(tasks)}
+    pending = {name: len(upstream) for name, upstream in tasks.items()}
+    downstream = {name: [] for name in tasks}
+
+    for name, upstream in tasks.items():
+        for up in upstream:
+            downstream[up].append(name)
+
+    levels = []
+    level = [name for name, count in pending.items() if not count]
+
+    while level:
+        levels.append(level)
+        next_level = []
+
+        for name in level:
+            for down in downstream[name]:
+                pending[down] -= 1
+
+                if not pending[down]:
+                    next_level.append(down)
+
+        # keep the original order within each level
+        level = sorted(next_level, key=order.get)
+
+    return levels
+
+
 # FIXME: move this logic to ploomber so we validate it
 # before and after we submit the code
 def _transform_task_resources(resources):
@@ -111,7 +200,7 @@ def _submit_dag(
     default_image_key = get_default_image_key()
     remote_name = image_map[default_image_key]
 
-    client = boto3.client("batch", region_name=region_name)
+    client = _batch_client(region_name)
     container_properties["image"] = remote_name
 
     jd_map = {}
@@ -126,14 +215,26 @@ def _submit_dag(
 
     if is_cloud:
         # docker.build moves to the env folder
-        params = json.loads(Path("../.ploomber-cloud").read_text())
+        params = _load_run_params("../.ploomber-cloud")
 
         # note: this will trigger an error if the user has no quota left
         from ploomber.cloud.api import PloomberCloudAPI
 
         out = PloomberCloudAPI().runs_update(params["runid"], tasks)
+
+        # same for all tasks, build them once
+        environment = [
+            {
+                "name": "PLOOMBER_CLOUD_KEY",
+                "value": os.environ["PLOOMBER_CLOUD_KEY"],
+            },
+            {
+                "name": "PLOOMBER_CLOUD_HOST",
+                "value": os.environ["PLOOMBER_CLOUD_HOST"],
+            },
+        ]
     else:
-        out, params = None, None
+        out, params, environment = None, None, None
 
     jd = client.register_job_definition(
         jobDefinitionName=job_def,
@@ -157,8 +258,10 @@ def _submit_dag(
             )
             jd_map[pattern] = jd
 
-    for name, upstream in tasks.items():
-        task_pattern = _find_task_pattern(list(image_map.keys()), name)
+    task_patterns = list(image_map)
+
+    def submit(name):
+        task_pattern = _find_task_pattern(task_patterns, name)
         task_pattern = task_pattern if task_pattern else default_image_key
         task_jd = jd_map[task_pattern]
 
@@ -174,16 +277,7 @@ def _submit_dag(
 
             container_overrides = {
                 "command": ploomber_task + args,
-                "environment": [
-                    {
-                        "name": "PLOOMBER_CLOUD_KEY",
-                        "value": os.environ["PLOOMBER_CLOUD_KEY"],
-                    },
-                    {
-                        "name": "PLOOMBER_CLOUD_HOST",
-                        "value": os.environ["PLOOMBER_CLOUD_HOST"],
-                    },
-                ],
+                "environment": environment,
             }
 
         else:
@@ -197,19 +291,53 @@ def _submit_dag(
             jobName=name,
             jobQueue=job_queue,
             jobDefinition=task_jd["jobDefinitionArn"],
-            dependsOn=[{"jobId": job_ids[name]} for name in upstream],
+            dependsOn=[{"jobId": job_ids[up]} for up in tasks[name]],
             containerOverrides=container_overrides,
         )
 
-        job_ids[name] = response["jobId"]
+        return response["jobId"]
+
+    # maps task name to the exception raised when submitting it
+    errors = {}
+
+    # tasks in the same level do not depend on each other, so we submit them
+    # concurrently. we wait for the level to finish before moving to the
+    # next one, since we need the job ids of the upstream dependencies
+    with ThreadPoolExecutor(max_workers=_MAX_SUBMIT_WORKERS) as executor:
+        for level in _upstream_levels(tasks):
+            futures = {executor.submit(submit, name): name for name in level}
+
+            # record every job that was submitted, even if others fail
+            for future in as_completed(futures):
+                name = futures[future]
 
-        cmdr.print(f"Submitted task {name!r}...")
+                try:
+                    job_ids[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+
+            # print in task order (not completion order) so output is stable
+            for name in level:
+                if name in job_ids:
+                    cmdr.print(f"Submitted task {name!r}...")
+
+            if errors:
+                break
 
     if is_cloud:
         from ploomber.cloud.api import PloomberCloudAPI
 
         PloomberCloudAPI().runs_register_ids(params["runid"], job_ids)
 
+    if errors:
+        failed = next(name for name in tasks if name in errors)
+        submitted = ", ".join(repr(name) for name in tasks if name in job_ids) or "none"
+        cmdr.warn(
+            f"Failed to submit task {failed!r}. "
+            f"Tasks already submitted: {submitted}"
+        )
+        raise errors[failed]
+
 
 class AWSBatchExporter(abc.AbstractExporter):
     CONFIG_CLASS = AWSBatchConfig
@@ -229,7 +357,9 @@ class AWSBatchExporter(abc.AbstractExporter):
     @staticmethod
     def _add(cfg, env_name):
         with Commander(
-            workspace=env_name, templates_path=("soopervisor", "assets")
+            workspace=env_name,
+            templates_path=("soopervisor", "assets"),
+            environment_kwargs=_templates.environment_kwargs(),
         ) as e:
             e.copy_template(
                 "docker/Dockerfile",
@@ -333,7 +463,7 @@ class CloudExporter(AWSBatchExporter):
     def _no_tasks_to_submit(cls):
         from ploomber.cloud.api import PloomberCloudAPI
 
-        params = json.loads(Path(".ploomber-cloud").read_text())
+        params = _load_run_params(".ploomber-cloud")
         PloomberCloudAPI().run_finished(params["runid"])
 
     @classmethod
@@ -39,9 +39,12 @@ def _extract_product_parent(task_spec):
 
 
 def product_prefixes_from_spec(spec):
-    parents = [_extract_product_parent(t) for t in spec["tasks"]]
-    parents_flat = [path for sub in parents for path in sub]
-    return sorted(set(parents_flat)) or None
+    parents = set()
+
+    for t in spec["tasks"]:
+        parents.update(_extract_product_parent(t))
+
+    return sorted(parents) or None
 
 
 def find_spec(cmdr, name, lazy_import=False):
@@ -12,13 +12,22 @@ from ploomber.util import default
 from click.exceptions import ClickException
 
 
+def project_name():
+    """
+    Returns the name of the current working directory. os.getcwd() already
+    returns a canonical path, so there is no need to Path(".").resolve(),
+    which stats every path component
+    """
+    return Path.cwd().name
+
+
 def find_package_name_and_version():
     # if this is a pkg, get the name
     try:
         pkg_name = default.find_package_name()
     # if not a package, use the parent folder's name
     except ValueError:
-        pkg_name = Path(".").resolve().name
+        pkg_name = project_name()
         version = "latest"
     else:
         # if using versioneer, the version may contain "+"
@@ -129,6 +138,7 @@ def copy(cmdr, src, dst, include=None, exclude=None, ignore_git=False, rename_fi
     overlap = set(include) & set(exclude)
 
     big_files = []
+    created = set()
 
     if overlap:
         raise ClickException(
@@ -160,6 +170,11 @@ def copy(cmdr, src, dst, include=None, exclude=None, ignore_git=False, rename_fi
             "flag to soopervisor export"
         )
 
+    # membership is checked once per file, use a set to avoid a linear
+    # scan over all tracked files each time
+    if tracked is not None:
+        tracked = set(tracked)
+
     for f in glob_all(path=src, exclude=dst):
         tracked_by_git = tracked is None or ignore_git or to_posix_str(f) in tracked
         excluded = f in exclude or is_relative_to_any(f, exclude_dirs)
@@ -171,7 +186,12 @@ def copy(cmdr, src, dst, include=None, exclude=None, ignore_git=False, rename_fi
                 target = Path(dst, rename_files[f])
             else:
                 target = Path(dst, f)
-            target.parent.mkdir(exist_ok=True, parents=True)
+
+            # many files share the same parent, only create it once
+            if target.parent not in created:
+                target.parent.mkdir(exist_ok=True, parents=True)
+                created.add(target.parent)
+
             shutil.copy(f, dst=target)
             print(f"Copying {f} -> {target}")
 
@@ -8,6 +8,7 @@ from pathlib import Path
 import click
 
 from ploomber.io._commander import Commander, CommanderStop
+from ploomber.products import MetaProduct
 from soopervisor.kubeflow.config import KubeflowConfig
 from soopervisor import commons
 from soopervisor import abc
@@ -68,24 +69,6 @@ class KubeflowExporter(abc.AbstractExporter):
             tasks, args = commons.load_tasks(
                 cmdr=e, name=env_name, mode=mode, task_name=task_name
             )
-            dag, relative_path = commons.load_dag(
-                cmdr=e, name=env_name, mode=mode, lazy_import=lazy_import
-            )
-            products_list = {}
-
-            # TODO deal with the second mode.
-            for name, task in dag.items():
-                product = task.product
-                products_list[name] = []
-                try:
-                    product.items()
-                    products = product.products.products
-                    for item in products:
-                        products_list[name].append(
-                            {item: str(Path(products[item]).resolve())}
-                        )
-                except AttributeError:  # Single product
-                    products_list[name].append(str(Path(product).resolve()))
 
             if not tasks:
                 raise CommanderStop(
@@ -93,6 +76,15 @@ class KubeflowExporter(abc.AbstractExporter):
                     'tasks to submit. Try "--mode force" to '
                     "submit all tasks regardless of status"
                 )
+
+            # only load the dag again (to get the products) if there is
+            # something to submit
+            dag, relative_path = commons.load_dag(
+                cmdr=e, name=env_name, mode=mode, lazy_import=lazy_import
+            )
+            # TODO deal with the second mode.
+            products_list = _products_by_task(dag)
+
             if skip_docker:
                 click.secho("Skipping docker build")
                 pkg_name, version = source.find_package_name_and_version()
@@ -130,6 +122,29 @@ class KubeflowExporter(abc.AbstractExporter):
             )
 
 
+def _products_by_task(dag):
+    """
+    Maps each task in the dag to a list with its absolute product paths,
+    MetaProducts become a list of {key: path} dictionaries
+    """
+    products_list = {}
+
+    # NOTE: abspath only manipulates the string, unlike Path.resolve(), which
+    # stats every path component to follow symlinks (not needed here)
+    for name, task in dag.items():
+        product = task.product
+
+        if isinstance(product, MetaProduct):
+            products_list[name] = [
+                {key: os.path.abspath(prod)}
+                for key, prod in product.products.products.items()
+            ]
+        else:
+            products_list[name] = [os.path.abspath(product)]
+
+    return products_list
+
+
 def _make_kubeflow_dag(name, dependencies, command):
     dag_task = {
         "name": name,
@@ -155,13 +155,21 @@ def _submit_to_slurm(tasks, args, workspace):
     # maps task name to SLURM job id
     name2id = {}
 
+    # maps script path to its compiled template, many tasks usually share
+    # the same script so we only parse each one once
+    templates = {}
+
     # iterate over tasks
     for name, upstream in tasks.items():
 
         # determine which script file to use
         script_sh = _script_name_for_task_name(name, workspace)
+
+        if script_sh not in templates:
+            templates[script_sh] = Template(script_sh.read_text())
+
         # generate script and save
-        job_sh = Template(script_sh.read_text())
+        job_sh = templates[script_sh]
 
         ploomber_command = " ".join(["ploomber", "task", name] + args)
         script = job_sh.render(name=name, command=ploomber_command)
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, Mock
+import os
+from unittest.mock import ANY, MagicMock, Mock
 from pathlib import Path
 import shutil
 
@@ -101,7 +102,7 @@ def test_export(
     p_home_mock = Mock()
     monkeypatch.setattr(commons.docker, "cp_ploomber_home", p_home_mock)
     boto3_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
     load_tasks_mock = Mock(wraps=commons.load_tasks)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
@@ -193,7 +194,7 @@ def test_export_single_task(
     p_home_mock = Mock()
     monkeypatch.setattr(commons.docker, "cp_ploomber_home", p_home_mock)
     boto3_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
     load_tasks_mock = Mock(wraps=commons.load_tasks)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
@@ -256,7 +257,7 @@ def test_export_multiple_images_load_tasks(
     load_tasks_mock,
 ):
     monkeypatch.setattr(batch, "uuid4", lambda: "uuid4")
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
     exporter = batch.AWSBatchExporter.new("soopervisor.yaml", "some-env")
@@ -300,7 +301,7 @@ def test_export_multiple_images_job_details(
     load_tasks_mock,
 ):
     monkeypatch.setattr(batch, "uuid4", lambda: "uuid4")
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
     exporter = batch.AWSBatchExporter.new("soopervisor.yaml", "some-env")
@@ -381,7 +382,7 @@ def test_export_multiple_images_dependencies_commands(
     load_tasks_mock,
 ):
     monkeypatch.setattr(batch, "uuid4", lambda: "uuid4")
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
     exporter = batch.AWSBatchExporter.new("soopervisor.yaml", "some-env")
@@ -434,7 +435,7 @@ def test_checks_the_right_spec(
     shutil.copy("src/my_project/pipeline.yaml", "src/my_project/pipeline.serve.yaml")
 
     boto3_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
 
     exporter = batch.AWSBatchExporter.new("soopervisor.yaml", "serve")
     exporter.add()
@@ -464,7 +465,7 @@ def mock_aws_batch(
     p_home_mock = Mock()
     monkeypatch.setattr(commons.docker, "cp_ploomber_home", p_home_mock)
     batch_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: batch_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: batch_mock)
     load_tasks_mock = Mock(wraps=commons.load_tasks)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
@@ -640,7 +641,7 @@ def mock_aws_batch_lazy_load(
     p_home_mock = Mock()
     monkeypatch.setattr(commons.docker, "cp_ploomber_home", p_home_mock)
     batch_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: batch_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: batch_mock)
     load_tasks_mock = Mock(wraps=commons.load_tasks)
     monkeypatch.setattr(commons, "load_tasks", load_tasks_mock)
 
@@ -662,3 +663,117 @@ def test_lazy_load(mock_aws_batch_lazy_load, monkeypatch):
         path_to_config="soopervisor.yaml", env_name="train", lazy_import=True
     )
     exporter.export(mode="incremental", lazy_import=True)
+
+
+@pytest.mark.parametrize(
+    "tasks, expected",
+    [
+        [{}, []],
+        [{"a": [], "b": []}, [["a", "b"]]],
+        [
+            {"a": [], "b": [], "e": ["a"], "c": ["a", "b"], "d": ["c"]},
+            [["a", "b"], ["e", "c"], ["d"]],
+        ],
+        [{"d": ["c"], "c": ["a"], "a": []}, [["a"], ["c"], ["d"]]],
+    ],
+)
+def test_upstream_levels(tasks, expected):
+    assert batch._upstream_levels(tasks) == expected
+
+
+def test_load_run_params(tmp_empty, monkeypatch):
+    path = Path(".ploomber-cloud")
+    path.write_text('{"runid": "some-id"}')
+
+    assert batch._load_run_params(".ploomber-cloud") == {"runid": "some-id"}
+
+    # cached while the file does not change
+    read_text = Mock()
+    monkeypatch.setattr(batch.Path, "read_text", read_text)
+    assert batch._load_run_params(".ploomber-cloud") == {"runid": "some-id"}
+    read_text.assert_not_called()
+    monkeypatch.undo()
+
+    path.write_text('{"runid": "another-id"}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert batch._load_run_params(".ploomber-cloud") == {"runid": "another-id"}
+
+
+@pytest.fixture
+def clear_batch_client_cache(monkeypatch):
+    # _batch_client sets up boto3's default session, restore it on teardown
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", None)
+    batch._client_for.cache_clear()
+    yield
+    # do not leak cached clients to other tests
+    batch._client_for.cache_clear()
+
+
+def test_batch_client_is_cached(clear_batch_client_cache):
+    client = batch._batch_client("us-east-1")
+
+    assert batch._batch_client("us-east-1") is client
+    assert batch._batch_client("us-west-2") is not client
+    assert client.meta.config.max_pool_connections == batch._MAX_SUBMIT_WORKERS
+
+
+def test_batch_client_uses_default_session(clear_batch_client_cache, monkeypatch):
+    session = Mock()
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", session)
+
+    client = batch._batch_client("us-east-1")
+
+    assert client is session.client.return_value
+    session.client.assert_called_once_with(
+        "batch", region_name="us-east-1", config=ANY
+    )
+
+
+def test_batch_client_uses_new_default_session(clear_batch_client_cache, monkeypatch):
+    first, second = Mock(), Mock()
+
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", first)
+    assert batch._batch_client("us-east-1") is first.client.return_value
+
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", second)
+    assert batch._batch_client("us-east-1") is second.client.return_value
+
+
+def test_submit_dag_reports_submitted_jobs_if_one_fails(monkeypatch):
+    def submit_job(jobName, **kwargs):
+        if jobName == "a":
+            raise ValueError("some error")
+
+        return {"jobId": f"id-{jobName}"}
+
+    client = Mock()
+    client.register_job_definition.return_value = {"jobDefinitionArn": "arn"}
+    client.submit_job.side_effect = submit_job
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: client)
+    cmdr = Mock()
+
+    with pytest.raises(ValueError, match="some error"):
+        batch._submit_dag(
+            tasks={"a": [], "b": [], "c": [], "d": ["a"]},
+            args=[],
+            job_def="job-def",
+            image_map={"default": "image"},
+            job_queue="your-job-queue",
+            container_properties={},
+            region_name="us-east-1",
+            cmdr=cmdr,
+            is_cloud=False,
+            cfg=Mock(task_resources=None),
+        )
+
+    submitted = {c.kwargs["jobName"] for c in client.submit_job.call_args_list}
+    printed = [c.args[0] for c in cmdr.print.call_args_list]
+
+    # "d" depends on the failed task, so it's never submitted
+    assert submitted == {"a", "b", "c"}
+    assert printed == ["Submitted task 'b'...", "Submitted task 'c'..."]
+    cmdr.warn.assert_called_once_with(
+        "Failed to submit task 'a'. Tasks already submitted: 'b', 'c'"
+    )
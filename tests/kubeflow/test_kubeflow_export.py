@@ -3,8 +3,9 @@ from unittest.mock import Mock, ANY
 
 import yaml
 import pytest
+from ploomber.products import File, MetaProduct
 
-from soopervisor.kubeflow.export import KubeflowExporter, commons
+from soopervisor.kubeflow.export import KubeflowExporter, commons, _products_by_task
 
 
 # Test the task output is same as it's product
@@ -71,3 +72,24 @@ def test_export(
         assert args in container_cmd
     assert get_task["container"]["image"] == "your-repository/name:0.1dev"
     assert spec["metadata"]["generateName"] == "my-project-"
+
+
+def test_products_by_task(tmp_empty):
+    dag = {
+        "single": Mock(product=File("out/single.csv")),
+        "meta": Mock(
+            product=MetaProduct(
+                {"nb": File("out/meta.ipynb"), "data": File("out/meta.csv")}
+            )
+        ),
+    }
+
+    root = Path(tmp_empty)
+
+    assert _products_by_task(dag) == {
+        "single": [str(root / "out" / "single.csv")],
+        "meta": [
+            {"nb": str(root / "out" / "meta.ipynb")},
+            {"data": str(root / "out" / "meta.csv")},
+        ],
+    }
@@ -228,6 +228,14 @@ def test_ignores_pycache(cmdr, tmp_empty):
     assert set(Path(p) for p in source.glob_all("dist")) == expected
 
 
+def test_project_name(tmp_empty):
+    Path("my-project").mkdir()
+    os.chdir("my-project")
+
+    assert source.project_name() == "my-project"
+    assert source.project_name() == Path(".").resolve().name
+
+
 def test_git_tracked_files(tmp_empty):
     Path("file").touch()
     Path("dir").mkdir()
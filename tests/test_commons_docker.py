@@ -3,6 +3,7 @@ Testing docker-related functions. Unlike test_commons.py, this file does not
 mock docker
 """
 
+import re
 import subprocess
 import platform
 from pathlib import Path
@@ -19,6 +20,8 @@ from soopervisor.commons.docker import prepare_env_file
 
 from test_commons import git_init
 
+_STEP = re.compile(r"^Step ", re.MULTILINE)
+
 
 def _process_docker_output(output):
     """Processes output from "docker build" """
@@ -30,34 +33,46 @@ def _process_docker_output(output):
     # STEP 2
     # even more stuff
 
-    lines = output.splitlines()
-    sections = []
+    # output is separated by an empty line, slice the original string
+    # between them, each section starts with the empty line
+    starts = list(_empty_line_offsets(output))
 
-    # output is separated by an empty line
-    empty = [idx for idx, line in enumerate(lines) if line == ""]
+    return [output[i : j - 1] for i, j in zip(starts, starts[1:])]
 
-    # split by each section
-    slices = list(zip(empty, empty[1:]))
 
-    for i, j in slices:
-        sections.append("\n".join(lines[i:j]))
+def _empty_line_offsets(output):
+    """Yields the offset where each empty line starts"""
+    if output.startswith("\n"):
+        yield 0
 
-    return sections
+    pos = output.find("\n\n")
+
+    while pos != -1:
+        yield pos + 1
+        pos = output.find("\n\n", pos + 1)
 
 
 def _process_docker_output_ci(output):
-    lines = output.splitlines()
+    # output (on github actions) looks like this:
 
-    sections = []
+    # Step 1/2 : FROM A
+    #  ---> hash
+    # Step 2/2 : RUN B
+    #  ---> hash
+    starts = [match.start() for match in _STEP.finditer(output)]
 
-    step = [idx for idx, line in enumerate(lines) if "Step " in line]
+    if not starts:
+        return []
 
-    slices = list(zip(step, step[1:]))
+    sections = []
 
-    for i, j in slices:
-        sections.append("\n".join(lines[i : j - 1]))
+    # each section goes until the line before the next step (excluded)
+    for i, j in zip(starts, starts[1:]):
+        end = output.rfind("\n", i, j - 1)
+        sections.append(output[i:end] if end != -1 else "")
 
-    sections.append("\n".join(lines[j:]))
+    last = output[starts[-1] :]
+    sections.append(last[:-1] if last.endswith("\n") else last)
 
     return sections
 
@@ -84,6 +99,36 @@ Step 3/7 : RUN D
     assert _process_docker_output_ci(out) == expected
 
 
+def test_process_docker_output_ci_single_step():
+    out = """\
+Step 1/1 : FROM A
+ ---> hash
+"""
+
+    assert _process_docker_output_ci(out) == ["Step 1/1 : FROM A\n ---> hash"]
+    assert _process_docker_output_ci("") == []
+
+
+def test_process_docker_output():
+    out = """\
+#1 ignored
+
+#2 STEP 1
+#2 more stuff
+
+#3 STEP 2
+#3 even more stuff
+
+"""
+
+    expected = [
+        "\n#2 STEP 1\n#2 more stuff",
+        "\n#3 STEP 2\n#3 even more stuff",
+    ]
+
+    assert _process_docker_output(out) == expected
+
+
 config_aws = """\
 my-env:
   backend: aws-batch
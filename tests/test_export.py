@@ -72,10 +72,10 @@ def test_add_creates_necessary_files(
 @pytest.fixture
 def monkeypatch_boto3_batch_client(monkeypatch):
     """
-    Mocks calls to boto3.client(...) in the batch module
+    Mocks the boto3 batch client in the batch module
     """
     boto3_mock = Mock(wraps=boto3.client("batch", region_name="us-east-1"))
-    monkeypatch.setattr(batch.boto3, "client", lambda name, region_name: boto3_mock)
+    monkeypatch.setattr(batch, "_batch_client", lambda region_name: boto3_mock)
 
 
 @pytest.fixture
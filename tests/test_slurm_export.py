@@ -169,6 +169,23 @@ def test_slurm_export_sample_project_matches_script_file(
     )
 
 
+def test_slurm_export_parses_shared_script_once(
+    monkeypatch_slurm, monkeypatch, tmp_sample_project
+):
+    load_tasks_mock, run_mock = monkeypatch_slurm
+
+    template_mock = Mock(wraps=Template)
+    monkeypatch.setattr(export, "Template", template_mock)
+
+    exporter = SlurmExporter.new(path_to_config="soopervisor.yaml", env_name="serve")
+    exporter.add()
+    exporter.export(mode="incremental")
+
+    # all tasks use template.sh
+    template_mock.assert_called_once()
+    assert run_mock.call_count == 3
+
+
 def test_slurm_export_sample_project_incremental(monkeypatch, tmp_sample_project):
     dag = DAGSpec("pipeline.yaml").to_dag()
     dag.build()
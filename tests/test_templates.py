@@ -0,0 +1,113 @@
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from jinja2 import Environment, PackageLoader, StrictUndefined, UndefinedError
+from ploomber.io._commander import to_pascal_case
+
+from soopervisor import _templates
+from soopervisor.airflow import export as airflow_export
+from soopervisor.aws import batch
+
+
+@pytest.fixture
+def env():
+    env = Environment(
+        loader=PackageLoader("soopervisor", "assets"), undefined=StrictUndefined
+    )
+    env.filters["to_pascal_case"] = to_pascal_case
+    return env
+
+
+@pytest.mark.parametrize(
+    "path, simple",
+    [
+        ["airflow/bash.py", True],
+        ["airflow/docker.py", True],
+        ["airflow/kubernetes.py", True],
+        ["docker/Dockerfile", False],
+        ["aws-lambda/template.yaml", False],
+    ],
+)
+def test_render_matches_jinja(env, path, simple):
+    kwargs = dict(
+        project_name="some-project",
+        env_name="serve",
+        conda=True,
+        setup_py=False,
+        lib=True,
+        package_name="some_package",
+    )
+
+    assert _templates._load(path)[1] is simple
+    assert _templates.render(path, **kwargs) == env.get_template(path).render(**kwargs)
+
+
+def test_render_error_if_missing_variable():
+    with pytest.raises(UndefinedError) as excinfo:
+        _templates.render("airflow/bash.py", env_name="serve")
+
+    assert "'project_name' is undefined" in str(excinfo.value)
+
+
+def test_render_crlf_source_matches_jinja(monkeypatch):
+    source = "a {{x}}\r\nb\r\n"
+    monkeypatch.setattr(
+        _templates.pkgutil, "get_data", lambda package, resource: source.encode()
+    )
+    _templates._load.cache_clear()
+
+    try:
+        out = _templates.render("some/template.txt", x=1)
+    finally:
+        _templates._load.cache_clear()
+
+    assert out == "a 1\nb"
+    assert out == Environment().from_string(source).render(x=1)
+
+
+@pytest.fixture
+def clear_bytecode_cache():
+    _templates.bytecode_cache.cache_clear()
+    yield
+    _templates.bytecode_cache.cache_clear()
+
+
+@pytest.mark.parametrize("error", [OSError, RuntimeError])
+def test_environment_kwargs_without_bytecode_cache(
+    clear_bytecode_cache, monkeypatch, error
+):
+    def raise_error():
+        raise error("Cannot determine safe temp directory")
+
+    monkeypatch.setattr(_templates, "FileSystemBytecodeCache", raise_error)
+
+    assert _templates.environment_kwargs() == {}
+
+
+def test_environment_kwargs_with_bytecode_cache(clear_bytecode_cache):
+    assert _templates.environment_kwargs() == dict(
+        bytecode_cache=_templates.bytecode_cache()
+    )
+
+
+@pytest.mark.parametrize(
+    "module, exporter",
+    [
+        [airflow_export, airflow_export.AirflowExporter],
+        [batch, batch.AWSBatchExporter],
+    ],
+)
+def test_add_uses_environment_kwargs(tmp_empty, monkeypatch, module, exporter):
+    commander = MagicMock()
+    monkeypatch.setattr(module, "Commander", commander)
+    Path("serve").mkdir()
+
+    exporter._add(SimpleNamespace(preset="bash"), "serve")
+
+    commander.assert_called_once_with(
+        workspace="serve",
+        templates_path=("soopervisor", "assets"),
+        environment_kwargs=_templates.environment_kwargs(),
+    )